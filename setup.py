@@ -27,9 +27,8 @@ setup(
         "click",
         "click_tree",
         "fabric2",
-        "pyre_extensions",
     ],
-    extras_require={"dev": ["ruff", "pyre-check"]},
+    extras_require={"dev": ["ruff", "pyre-check", "pytest"]},
     entry_points="""
     [console_scripts]
     smn=smn.cli:smn
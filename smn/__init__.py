@@ -1,16 +1,32 @@
 #!/usr/bin/env python3
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 from sys import stdin
 
 import click
-from click_tree import ClickTreeParam
-from fabric.config import Config
 
-from smn.context import Context, pass_context  # noqa: F401
+from smn.utils import TomeGroup, _LazyClickTreeParam
+
+if TYPE_CHECKING:
+    from smn.context import Context, pass_context  # noqa: F401
+
+
+# pyre-fixme[3]: Return type must be specified as type that does not contain `Any`.
+def __getattr__(name: str) -> Any:
+    # Context and pass_context are loaded on first access, since smn.context pulls
+    # in all of fabric and invoke. Tomes almost always import them, so this only
+    # keeps those imports off of the path where no tome is loaded at all.
+    if name in ("Context", "pass_context"):
+        from smn.context import Context, pass_context
+
+        globals().update(Context=Context, pass_context=pass_context)
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @click.group(
     name="smn",
+    cls=TomeGroup,
     context_settings={"help_option_names": ["--smn-help"]},
 )
 @click.option(
@@ -23,7 +39,7 @@ from smn.context import Context, pass_context  # noqa: F401
 @click.option(
     "--tree",
     is_flag=True,
-    type=ClickTreeParam(scoped=True, ignore_names=["smn-run"]),
+    type=_LazyClickTreeParam(scoped=True, ignore_names=["smn-run"]),
     help="enable tree display",
 )
 @click.option("--dry-run", is_flag=True, default=False, help="enable dry-run mode")
@@ -58,17 +74,21 @@ def tome(
     # Create our smn Context conditionally using a supplied remote host if any,
     # and set it on the current click.Context. This is more or less what the
     # ensure=True flag on make_pass_decorator does under the hood, but this allows
-    # for constructing the Context with our own arguments.
+    # for constructing the Context with our own arguments. Both are imported here
+    # along with the rest of fabric, see __getattr__ above.
+    from fabric.config import Config
+
+    from smn.context import Context
+
     ctx = Context(host)
     click_ctx.obj = ctx
 
     ctx._set(smn_dry_run=dry_run)
     ctx._set(smn_debug=debug)
 
-    cfg = {}
-    cfg["run"] = {
+    run_cfg = {
         # Enable echo of all running commands.
-        "echo": ctx.smn_debug,
+        "echo": debug,
         # Mirror tty configuration of environment that is invoking smn. For example,
         # echo '{}' | tee empty.json will set pty=False, which will allow stdin
         # to flow in.
@@ -77,4 +97,6 @@ def tome(
         "dry": disable_execution,
     }
 
-    ctx.config = Config(overrides=cfg)
+    # Set via _set like the other attributes, plain assignment goes through
+    # DataProxy.__setattr__, which scans dir(ctx) to find the config property.
+    ctx._set(config=Config(overrides={"run": run_cfg}))
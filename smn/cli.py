@@ -1,22 +1,65 @@
 #!/usr/bin/env python3
+import os
 import sys
 from importlib.machinery import ModuleSpec
 from importlib.util import find_spec, module_from_spec, spec_from_file_location
-from os.path import splitext
-from pathlib import Path
+from os.path import dirname, isfile, join, splitext
 from logging import Logger, getLogger
 from typing import Tuple, Optional
 
 import click
-from invoke.exceptions import CollectionNotFound
-from invoke.loader import FilesystemLoader
-from pyre_extensions import none_throws
 
 from smn import tome
+from smn.utils import _nn
 
 logger: Logger = getLogger(__name__)
 
 
+class TomeNotFoundError(FileNotFoundError):
+    """No root tome could be located between the working directory and root."""
+
+
+def find_tome() -> ModuleSpec:
+    """Find the nearest root tome.
+
+    This walks upwards from the current working directory to the filesystem root,
+    looking for either a tome.py file or a tome package directory.
+
+    Returns:
+        module_spec: ModuleSpec. Spec for the located root tome module.
+
+    Raises:
+        TomeNotFoundError: If no root tome exists in any directory between the
+            current working directory and root.
+    """
+
+    cwd = os.getcwd()
+    parent = cwd
+    while True:
+        module_file = join(parent, "tome.py")
+        if isfile(module_file):
+            return _nn(spec_from_file_location("tome", module_file))
+
+        package_dir = join(parent, "tome")
+        if isfile(join(package_dir, "__init__.py")):
+            return _nn(
+                spec_from_file_location(
+                    "tome",
+                    join(package_dir, "__init__.py"),
+                    submodule_search_locations=[package_dir],
+                )
+            )
+
+        # dirname() of the filesystem root is the root itself.
+        next_parent = dirname(parent)
+        if next_parent == parent:
+            break
+
+        parent = next_parent
+
+    raise TomeNotFoundError(f"could not find tome.py in {cwd} or any parent")
+
+
 def load_cli(path: Optional[str] = None) -> None:
     """Locate and load the root Summoner tome.
 
@@ -35,17 +78,16 @@ def load_cli(path: Optional[str] = None) -> None:
             tome.
 
     Raises:
-        CollectionNotFound: If no tome.py file could be located in any directory
+        TomeNotFoundError: If no tome.py file could be located in any directory
             between the current working directory and root.
         ValueError: If a root tome module or file exists, but yields no valid
             module spec.
     """
 
     if not path:
-        # Use invoke's loader to find a module tome.py in any directory between
-        # the current working directory and root.
-        loader = FilesystemLoader()
-        module_spec = loader.find("tome")
+        # Find a module tome.py in any directory between the current working
+        # directory and root.
+        module_spec = find_tome()
     elif splitext(path)[1] == ".py":
         # Path is (probably) a file, attempt to load a spec at this path.
         module_spec = spec_from_file_location("tome", path)
@@ -59,13 +101,13 @@ def load_cli(path: Optional[str] = None) -> None:
 
     # Make the path that the located root tome file is present in the first python
     # path, allowing for "local" imports.
-    module_path = Path(none_throws(module_spec.origin)).parent
+    module_path = dirname(_nn(module_spec.origin))
     if sys.path[0] != module_path:
-        sys.path.insert(0, str(module_path))
+        sys.path.insert(0, module_path)
 
     # Load and execute the located root tome module.
     module = module_from_spec(module_spec)
-    none_throws(module_spec.loader).exec_module(module)
+    _nn(module_spec.loader).exec_module(module)
 
 
 @click.command(
@@ -97,7 +139,7 @@ def smn(_tome: Optional[str], smn_help: bool, command: Tuple[str, ...]) -> None:
     try:
         # Load a root tome to program the smn click Group.
         load_cli(_tome)
-    except CollectionNotFound:
+    except TomeNotFoundError:
         # If the user passed --smn-help, then just show the unprogrammed help
         # for the smn CLI. In all other cases, print a failure to load and exit
         # with a nonzero code.
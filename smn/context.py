@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
-from typing import Any, Callable, Tuple, Optional
+import shlex
+from typing import Any, Callable, Optional, Tuple
 
 import click
 from invoke.exceptions import UnexpectedExit
@@ -66,7 +67,8 @@ class Context(Connection):
         """Run an "entrypoint".
 
         This is intended for use inside of smn-run entrypoints, and will pass
-        through all arguments from smn to a given named command.
+        through all arguments from smn to a given named command. Arguments are
+        shell quoted, so they reach the command exactly as they were passed to smn.
 
         Args:
             name: str. Name of the command to run.
@@ -75,7 +77,7 @@ class Context(Connection):
         """
 
         try:
-            self.run(f"{name} {' '.join(command)}")
+            self.run(f"{name} {shlex.join(command)}")
         except UnexpectedExit as e:
             # Re-raise nonzero exit code from entrypoint.
             raise click.exceptions.Exit(e.result.exited)
@@ -2,14 +2,63 @@
 # Taken from: https://github.com/click-contrib/click-default-group
 # (Most) type hints added. Also removed the custom HelpFormatter as it isn't
 # really necessary.
-from typing import Any, Callable, List, Optional, Tuple, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 from warnings import warn
 
 import click
-from pyre_extensions import none_throws
 
+T = TypeVar("T")
 
-class DefaultGroup(click.Group):
+
+def _nn(value: Optional[T]) -> T:
+    """Local equivalent of pyre_extensions.none_throws."""
+    if value is None:
+        raise AssertionError("Unexpected None")
+
+    return value
+
+
+class AddCommandsMixin(click.Group):
+    """Mixin for click Groups to register many commands at once."""
+
+    def add_commands(
+        self,
+        # pyre-fixme[2]: Parameter `cmds` must have a type that does not contain `Any`.
+        cmds: Dict[str, Union[click.Command, Callable[..., Any]]],
+    ) -> None:
+        """Register a mapping of command names to callbacks.
+
+        Callbacks are turned into commands directly, using any parameters added to
+        them with click.option/click.argument and their docstring as help, instead
+        of going through the click.command decorator for each one. Existing click
+        Commands are registered under the given name.
+        """
+
+        for name, cmd in cmds.items():
+            if not isinstance(cmd, click.Command):
+                cmd = click.Command(
+                    name=name,
+                    callback=cmd,
+                    # Parameter decorators are applied bottom up, so reverse them
+                    # back into declaration order, same as click.command does.
+                    params=list(reversed(getattr(cmd, "__click_params__", []))),
+                    help=cmd.__doc__,
+                )
+
+            self.add_command(cmd, name)
+
+
+class DefaultGroup(AddCommandsMixin, click.Group):
     """Click command group with default command functionality.
 
     Invokes a subcommand marked with `default=True` if any subcommand not
@@ -43,18 +92,19 @@ class DefaultGroup(click.Group):
 
     def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
         if not args and self.default_if_no_args:
-            args.insert(0, none_throws(self.default_cmd_name))
+            args.insert(0, _nn(self.default_cmd_name))
 
         return super().parse_args(ctx, args)
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
-        if cmd_name not in self.commands:
+        cmd = self.commands.get(cmd_name)
+        if cmd is None:
             # No command name matched.
             # pyre-fixme[16]: `click.core.Context` has no attribute `arg0`.
             ctx.arg0 = cmd_name
-            cmd_name = none_throws(self.default_cmd_name)
+            cmd = self.commands.get(_nn(self.default_cmd_name))
 
-        return super().get_command(ctx, cmd_name)
+        return cmd
 
     def resolve_command(
         self, ctx: click.Context, args: List[str]
@@ -101,3 +151,42 @@ class DefaultGroup(click.Group):
             return cmd
 
         return _decorator
+
+
+class _LazyClickTreeParam(click.ParamType):
+    """Deferred click_tree ClickTreeParam.
+
+    This behaves exactly like click_tree's ClickTreeParam, but defers the import
+    of click_tree until the flag is set (or has a non-bool value), keeping it off
+    of the startup path for all other invocations.
+
+    Args:
+        scoped: bool. Passed through to ClickTreeParam.
+        ignore_names: Optional[List[str]]. Passed through to ClickTreeParam.
+    """
+
+    name = "tree"
+
+    def __init__(
+        self, scoped: bool = False, ignore_names: Optional[List[str]] = None
+    ) -> None:
+        self.scoped = scoped
+        self.ignore_names = ignore_names
+
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> Any:
+        if value is False:
+            # Flag was not set, nothing to display. Same result as ClickTreeParam,
+            # anything else is left to it to validate.
+            return None
+
+        from click_tree import ClickTreeParam
+
+        return ClickTreeParam(
+            scoped=self.scoped, ignore_names=self.ignore_names
+        ).convert(value, param, ctx)
+
+
+class TomeGroup(AddCommandsMixin, click.Group):
+    """Root tome click Group."""
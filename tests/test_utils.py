@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+from typing import Tuple
+
+import click
+from click.testing import CliRunner
+
+from smn.context import Context, pass_context
+from smn.utils import DefaultGroup, TomeGroup
+
+
+def invoke(group: click.Group, *args: str) -> str:
+    result = CliRunner().invoke(group, args, catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+
+    return result.output
+
+
+def test_default_group() -> None:
+    tome = TomeGroup("smn")
+
+    @tome.group("grp", cls=DefaultGroup, default="smn-run", default_if_no_args=True)
+    def grp() -> None:
+        pass
+
+    @grp.command("smn-run", context_settings={"ignore_unknown_options": True})
+    @click.argument("command", nargs=-1, type=click.UNPROCESSED)
+    def smn_run(command: Tuple[str, ...]) -> None:
+        click.echo(f"smn-run {' '.join(command)}")
+
+    @grp.command("other")
+    def other() -> None:
+        click.echo("other ran")
+
+    assert invoke(tome, "grp") == "smn-run \n"
+    assert invoke(tome, "grp", "a", "b") == "smn-run a b\n"
+    assert invoke(tome, "grp", "other") == "other ran\n"
+
+
+def test_add_commands() -> None:
+    @click.group("smn", cls=TomeGroup)
+    @click.pass_context
+    def tome(click_ctx: click.Context) -> None:
+        # Set an smn Context for pass_context to find, same as the root tome.
+        click_ctx.obj = Context("local")
+
+    @click.option("--first", default="1")
+    @click.option("--second", default="2")
+    @click.argument("third", default="3")
+    def ordered(first: str, second: str, third: str) -> None:
+        """Prints its params."""
+        click.echo(f"{first} {second} {third}")
+
+    @pass_context
+    def with_context(ctx: Context) -> None:
+        """Uses the smn Context."""
+        click.echo(f"local={ctx.smn_is_local}")
+
+    @click.command("original")
+    def existing() -> None:
+        click.echo("existing ran")
+
+    tome.add_commands(
+        {"ordered": ordered, "with-context": with_context, "renamed": existing}
+    )
+
+    cmd = tome.commands["ordered"]
+    assert [param.name for param in cmd.params] == ["first", "second", "third"]
+    assert cmd.help == "Prints its params."
+    assert tome.commands["with-context"].help == "Uses the smn Context."
+    assert tome.commands["renamed"] is existing
+    assert "original" not in tome.commands
+
+    assert invoke(tome, "ordered", "--second", "b", "c") == "1 b c\n"
+    assert invoke(tome, "with-context") == "local=True\n"
+    assert invoke(tome, "renamed") == "existing ran\n"